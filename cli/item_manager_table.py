@@ -5,6 +5,8 @@ from rich.console import Console
 from rich.text import Text
 from rich.table import Table
 
+console = Console()
+
 @dataclass
 class Item:
     id: str
@@ -108,7 +110,6 @@ class ItemManager:
         return tuples
 
     def print_items_as_table(self):
-        console = Console()
         table = Table(title="Items")
         table.add_column("Item Name", justify="left", style="bold")
 
@@ -1,7 +1,7 @@
 from itertools import chain
 import json
 from datetime import datetime
-from typing import Dict, List, Optional, Iterable
+from typing import Dict, FrozenSet, List, Optional, Iterable, Set, Tuple
 
 from jira import JIRA
 from jira.exceptions import JIRAError
@@ -12,7 +12,7 @@ from prompt_toolkit.lexers import PygmentsLexer
 from prompt_toolkit.shortcuts import confirm
 from prompt_toolkit.styles import Style
 from prompt_toolkit.validation import ValidationError, Validator
-from prompt_toolkit.formatted_text import HTML, merge_formatted_text
+from prompt_toolkit.formatted_text import AnyFormattedText, HTML, merge_formatted_text
 from pygments.lexer import RegexLexer
 from pygments.token import (Error, Keyword, Name,
                              Operator, Punctuation,
@@ -258,7 +258,7 @@ class JQLValidator(Validator):
     def validate(self, document):
         """ Validate JQL query. """
         text = document.text
-        if text.lower() == "b" or text.lower() == "exit":
+        if text.lower() in ("b", "exit"):
             return
         try:
             self.jira.search_issues(text, maxResults=1)
@@ -272,6 +272,17 @@ class JQLCompleter(Completer):
 
     def __init__(self, categorized_completions: Dict[str, List[str]]):
         self.categorized_completions = categorized_completions
+        # Lowercase every word once instead of on every keystroke.
+        self.lowered_completions: Dict[str, List[Tuple[str, str]]] = {
+            category: [(word, word.lower()) for word in words]
+            for category, words in categorized_completions.items()
+        }
+        self.operators: FrozenSet[str] = frozenset(categorized_completions.get("Operators", []))
+        self.attributes: FrozenSet[str] = frozenset(categorized_completions.get("Attributes", []))
+        self.completion_styles: Dict[str, Tuple[str, str]] = {}
+        for category in categorized_completions:
+            color = JQLStyles.completion.get(category, "white")
+            self.completion_styles[category] = (f"fg: #D8DEE9 bg: {color}", f"fg: {color} bg: #D8DEE9")
 
     def get_completions(self, document, complete_event) -> Iterable[Completion]:
         text_before_cursor = document.text_before_cursor.lower().strip()
@@ -293,7 +304,7 @@ class JQLCompleter(Completer):
             return chain(self._get_category_completions("Functions"),
                          self._get_category_completions("Attributes"))
 
-        if last_word in self.categorized_completions.get("Operators", []):
+        if last_word in self.operators:
             return self._get_category_completions("Projects")
 
         if last_word in ["order", "by"]:
@@ -302,21 +313,22 @@ class JQLCompleter(Completer):
         if "order by" in text_before_cursor:
             return self._get_category_completions("Order")
 
-        if last_word in self.categorized_completions.get("Attributes", []):
+        if last_word in self.attributes:
             return self._get_category_completions("Operators")
 
         return []
 
     def _get_current_word_completions(self, word: str) -> Iterable[Completion]:
-        for category, words in self.categorized_completions.items():
-            for completion_word in words:
-                if word in completion_word.lower():
+        for category, words in self.lowered_completions.items():
+            style, selected_style = self.completion_styles[category]
+            for completion_word, lowered_word in words:
+                if word in lowered_word:
                     yield Completion(completion_word,
                                      start_position=-len(word),
                                      display=completion_word,
                                      display_meta=category,
-                                     style=f"fg: #D8DEE9 bg: {JQLStyles.completion.get(category, 'white')}",
-                                     selected_style=f"fg: {JQLStyles.completion.get(category, 'white')} bg: #D8DEE9",
+                                     style=style,
+                                     selected_style=selected_style,
                                     )
 
     def _get_category_completions(self, category: str) -> Iterable[Completion]:
@@ -348,16 +360,27 @@ class JQLPrompt:
         self.issue_count: int = 0
         self.total_issue_count: int = 0
         self.issues: List[Issue] = []
+        self.query_count_state: Optional[Tuple[int, int, int, int]] = None
+        self.query_count_text: Optional[AnyFormattedText] = None
 
     def get_query_count(self):
+        """ Bottom toolbar with the query and issue counts.
+        prompt_toolkit calls this on every redraw, so the formatted text is only
+        rebuilt when a count or the console width changes.
+        """
         space = self.console.width // 3
+        state = (space, self.query_count, self.issue_count, self.total_issue_count)
+        if state == self.query_count_state:
+            return self.query_count_text
         query_count_str = f"Query Count: {self.query_count}" if self.query_count else ""
         query_count_html = HTML(f"<b><style fg='#2E3440' bg='#88C0D0'>{query_count_str:^{space}}</style></b>")
         issue_count_str = f"Issues Added: {self.issue_count}" if self.issue_count else ""
         issue_count_html = HTML(f"<b><style fg='#2E3440' bg='#B48EAD'>{issue_count_str:^{space}}</style></b>")
         total_issue_count_str = f"Total Issues: {self.total_issue_count}" if self.total_issue_count else ""
         total_issue_count_html = HTML(f"<b><style fg='#2E3440' bg='#D8DEE9'>{total_issue_count_str:^{space}}</style></b>")
-        return merge_formatted_text([query_count_html, issue_count_html, total_issue_count_html])
+        self.query_count_state = state
+        self.query_count_text = merge_formatted_text([query_count_html, issue_count_html, total_issue_count_html])
+        return self.query_count_text
 
     def create_jql_prompt_session(self):
         completer: JQLCompleter = JQLCompleter(completions)
@@ -381,6 +404,7 @@ class JQLPrompt:
             Optional[List[Issue]]: List of JIRA issues.
         """
         user_input: str = self.session.prompt()
+        command: str = user_input.lower()
         self.issue_count = 0
         if not user_input:
             do_empty_query = confirm(
@@ -389,9 +413,9 @@ class JQLPrompt:
             )
             if not do_empty_query:
                 return
-        if user_input.lower() == "b":
+        if command == "b":
             return
-        if user_input.lower() == "exit":
+        if command == "exit":
             exit(0)
         issues = self.jira.search_issues(user_input)
         if issues:
@@ -412,11 +436,13 @@ class JQLPrompt:
             Optional[List[Issue]]: List of JIRA issues.
         """
         self.issues = []
+        seen_issue_ids: Set[str] = set()
         while True:
             try:
                 issues = self.prompt()
                 if issues:
-                    issues = [issue for issue in issues if issue not in self.issues]
+                    issues = [issue for issue in issues if issue.id not in seen_issue_ids]
+                    seen_issue_ids.update(issue.id for issue in issues)
                     self.issues.extend(issues)
                     self.issue_count += len(issues)
                     self.total_issue_count += len(issues)
@@ -1,6 +1,7 @@
-from prompt_toolkit.key_binding import KeyBindings, merge_key_bindings
+from functools import lru_cache
+
 from prompt_toolkit.key_binding.bindings.basic import load_basic_bindings
-from prompt_toolkit.shortcuts import prompt, PromptSession
+from prompt_toolkit.shortcuts import PromptSession
 from prompt_toolkit.validation import Validator
 from rich.table import Table
 from rich.console import Console
@@ -24,13 +25,15 @@ def process_input(event):
     print(dir(event))
     event.app.exit(result=event.current_buffer.text)
 
-bindings_info = [
-    {"Key": "Ctrl-Q", "Action": "Exit the application"},
-    {"Key": "Ctrl-M", "Action": "Open the menu"},
-]
+bindings_info = (
+    ("Ctrl-Q", "Exit the application"),
+    ("Ctrl-M", "Open the menu"),
+)
+
+yes_no_answers = frozenset({"y", "n", "Y", "N", ""})
 
 def is_y_n(text):
-    return text in ["y", "n", "Y", "N", ""]
+    return text in yes_no_answers
 
 yes_no_validator = Validator.from_callable(
     is_y_n,
@@ -38,24 +41,37 @@ yes_no_validator = Validator.from_callable(
     move_cursor_to_end=True,
 )
 
+@lru_cache(maxsize=None)
+def get_confirm_session() -> PromptSession:
+    """ Create the confirm session on first use and reuse it afterwards. """
+    return PromptSession(validator=yes_no_validator)
+
 def confirm(message: str = "Confirm?", suffix: str = " (y/n) \u276f ") -> bool:
-    result = prompt(f"{message}{suffix}", validator=yes_no_validator)
+    result = get_confirm_session().prompt(f"{message}{suffix}")
     return result.lower() == "y" or result == ""
 
 
 console = Console()
 
 
-def show_keybindings_menu():
+def build_keybindings_table():
     table = Table(title="Keybindings")
 
     table.add_column("Key", justify="right", style="cyan", no_wrap=True)
     table.add_column("Action", style="magenta")
 
-    for binding in bindings_info:
-        table.add_row(binding["Key"], binding["Action"])
+    for key, action in bindings_info:
+        table.add_row(key, action)
 
-    console.print(table)
+    return table
+
+
+# The bindings never change at runtime, so build the table once.
+keybindings_table = build_keybindings_table()
+
+
+def show_keybindings_menu():
+    console.print(keybindings_table)
 
 
 def main_menu():
@@ -31,35 +31,25 @@ class TabbedWindow(QMainWindow):
         self.tab_widget = QTabWidget()
         self.setCentralWidget(self.tab_widget)
 
-        self.tab1 = QWidget()
-        self.tab_widget.addTab(self.tab1, "1-100")
+        self.tab1 = self.add_number_tab(1, 100)
+        self.tab2 = self.add_number_tab(101, 200)
 
-        layout1 = QGridLayout()
-        layout1.setHorizontalSpacing(10)
-        layout1.setVerticalSpacing(10)
+    def add_number_tab(self, start, end, columns=10):
+        """Adds a tab displaying the numbers from start to end in a grid."""
+        tab = QWidget()
+        self.tab_widget.addTab(tab, f"{start}-{end}")
 
-        for i in range(1, 101):
-            column = (i - 1) % 10
-            row = (i - 1) // 10
-            label = QLabel(str(i))
-            layout1.addWidget(label, row, column)
+        layout = QGridLayout()
+        layout.setHorizontalSpacing(10)
+        layout.setVerticalSpacing(10)
 
-        self.tab1.setLayout(layout1)
+        add_widget = layout.addWidget
+        for index, text in enumerate(map(str, range(start, end + 1))):
+            row, column = divmod(index, columns)
+            add_widget(QLabel(text), row, column)
 
-        self.tab2 = QWidget()
-        self.tab_widget.addTab(self.tab2, "101-200")
-
-        layout2 = QGridLayout()
-        layout2.setHorizontalSpacing(10)
-        layout2.setVerticalSpacing(10)
-
-        for i in range(101, 201):
-            column = (i - 101) % 10
-            row = (i - 101) // 10
-            label = QLabel(str(i))
-            layout2.addWidget(label, row, column)
-
-        self.tab2.setLayout(layout2)
+        tab.setLayout(layout)
+        return tab
 
 
 if __name__ == "__main__":
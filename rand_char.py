@@ -14,24 +14,14 @@ Usage:
 import random
 from argparse import ArgumentParser
 
+# Every code point below the surrogate range (0xD800 to 0xDFFF).
+CODE_POINTS = range(0x0, 0xD800)
+
 
 def generate_string(length):
     characters = ""
     try:
-        characters = "".join(
-            [
-                chr(
-                    random.choice(
-                        [
-                            i
-                            for i in range(0x0, 0xD7FF + 1)
-                            if i < 0xD800 or i > 0xDFFF
-                        ]
-                    )
-                )
-                for _ in range(length)
-            ]
-        )
+        characters = "".join(map(chr, random.choices(CODE_POINTS, k=length)))
     except UnicodeEncodeError as e:
         print(f"Error encoding character: {e}")
 
@@ -7,31 +7,41 @@ autocomplete support (press tab to auto-complete creature names), and quit the
 application.
 """
 import readline
+import sys
+from bisect import bisect_left, insort
 
+# Kept sorted so completions can be found with a binary search.
 creatures = []
+# Creature names are only completed while lookup_creature is prompting.
+lookup_active = False
 
 
 def add_creature():
     creature = input("Enter a creature name: ")
-    creatures.append(creature)
+    insort(creatures, creature)
     print(f"{creature} added to the list of creatures.")
 
 
-def lookup_creature():
-    def completer(text, state):
-        options = [c for c in creatures if c.startswith(text)]
-        if state < len(options):
-            return options[state]
-        else:
-            return None
+def complete_creature(text, state):
+    if not lookup_active:
+        return None
+    # All names starting with text form one run beginning at the
+    # insertion point of text, so the state-th match is found directly.
+    index = bisect_left(creatures, text) + state
+    if index < len(creatures) and creatures[index].startswith(text):
+        return creatures[index]
+    else:
+        return None
 
-    readline.set_completer(completer)
-    readline.parse_and_bind("tab: complete")
+
+def lookup_creature():
+    global lookup_active
 
     print("List of creatures:")
     for creature in creatures:
         print(f"- {creature}")
 
+    lookup_active = True
     while True:
         creature = input(
             "Enter the name of a creature or press enter to return to the main menu: "
@@ -42,20 +52,22 @@ def lookup_creature():
             print(f"{creature} found!")
         else:
             print(f"{creature} not found.")
-
-    readline.set_completer(None)
-    readline.parse_and_bind("tab: ")
+    lookup_active = False
 
 
 def quit():
     print("Goodbye!")
-    exit()
+    sys.exit()
 
 
 menu = {"1": add_creature, "2": lookup_creature, "3": quit}
 
 
 def main():
+    readline.set_completer(complete_creature)
+    readline.parse_and_bind("tab: complete")
+
+    get_action = menu.get
     while True:
         print("Menu:")
         print("[1] Add Creature")
@@ -63,7 +75,7 @@ def main():
         print("[3] Quit")
 
         choice = input("Enter your choice: ")
-        action = menu.get(choice)
+        action = get_action(choice)
         if action:
             action()
         else:
@@ -9,6 +9,7 @@ It leverages the `cmd` module to build the CLI and has tab-completion
 functionality for adding items from the predefined list of card names.
 """
 import cmd
+from bisect import bisect_left
 
 completions = [
     "Mage Slayer (Alara Reborn)",
@@ -20,6 +21,9 @@ completions = [
     "Sen Triplets (Alara Reborn)",
 ]
 
+# Sorted once so complete_add can jump to the first name matching a prefix.
+sorted_completions = sorted(completions)
+
 
 class mycmd(cmd.Cmd):
     def __init__(self):
@@ -34,7 +38,14 @@ class mycmd(cmd.Cmd):
     def complete_add(self, text, line, begidx, endidx):
         mline = line.partition(" ")[2]
         offs = len(mline) - len(text)
-        return [s[offs:] for s in completions if s.startswith(mline)]
+        start = bisect_left(sorted_completions, mline)
+        matches = []
+        for i in range(start, len(sorted_completions)):
+            s = sorted_completions[i]
+            if not s.startswith(mline):
+                break
+            matches.append(s[offs:])
+        return matches
 
 
 if __name__ == "__main__":
@@ -12,6 +12,7 @@ Functions:
     - generate_key_pair(storage_path: Path): Generates a key pair and a
       certificate and writes them to the specified storage path.
 """
+import os
 from argparse import ArgumentParser, Namespace
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -19,7 +20,7 @@ from pathlib import Path
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.asymmetric import ec
 from cryptography.x509.oid import NameOID
 
 
@@ -43,8 +44,8 @@ def parse_args() -> Namespace:
 
 
 def generate_key_pair(storage_path: Path):
-    """Generates a private key and a self-signed certificate and saves them to
-    the specified storage path.
+    """Generates an ECDSA P-256 private key and a self-signed certificate and
+    saves them to the specified storage path.
 
     Args:
         storage_path (Path): The directory where the private key and certificate
@@ -53,9 +54,10 @@ def generate_key_pair(storage_path: Path):
     Returns:
         None
     """
-    private_key = rsa.generate_private_key(
-        public_exponent=65537, key_size=4096, backend=default_backend()
-    )
+    backend = default_backend()
+    now = datetime.utcnow()
+
+    private_key = ec.generate_private_key(ec.SECP256R1(), backend=backend)
 
     subject = issuer = x509.Name(
         [
@@ -77,13 +79,13 @@ def generate_key_pair(storage_path: Path):
         .issuer_name(issuer)
         .public_key(private_key.public_key())
         .serial_number(x509.random_serial_number())
-        .not_valid_before(datetime.utcnow())
-        .not_valid_after(datetime.utcnow() + timedelta(days=365))
+        .not_valid_before(now)
+        .not_valid_after(now + timedelta(days=365))
         .add_extension(
             x509.SubjectAlternativeName([x509.DNSName("localhost")]),
             critical=False,
         )
-        .sign(private_key, hashes.SHA256(), default_backend())
+        .sign(private_key, hashes.SHA256(), backend)
     )
 
     if not storage_path.exists():
@@ -93,8 +95,16 @@ def generate_key_pair(storage_path: Path):
     with publickey_path.open("wb") as file:
         file.write(cert.public_bytes(serialization.Encoding.PEM))
 
+    # Create the private key owner-only rather than relying on the umask, and
+    # tighten a key.pem left over from an earlier run, which os.open's mode
+    # does not touch.
     privatekey_path = storage_path / "key.pem"
-    with privatekey_path.open("wb") as file:
+    with open(
+        privatekey_path,
+        "wb",
+        opener=lambda path, flags: os.open(path, flags, 0o600),
+    ) as file:
+        os.fchmod(file.fileno(), 0o600)
         file.write(
             private_key.private_bytes(
                 encoding=serialization.Encoding.PEM,
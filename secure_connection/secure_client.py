@@ -15,21 +15,23 @@ Functions:
     communication session with the specified server.
 """
 from socket import create_connection, socket
-from ssl import SSLContext, PROTOCOL_TLS_CLIENT, CERT_NONE
+from ssl import SSLContext, PROTOCOL_TLS_CLIENT, CERT_NONE, TLSVersion
 
 
 def main(server_address: str, server_port: int):
     context = SSLContext(PROTOCOL_TLS_CLIENT)
     context.check_hostname = False
     context.verify_mode = CERT_NONE
+    # TLS 1.3 only: one round trip for the handshake and AEAD ciphers only.
+    context.minimum_version = TLSVersion.TLSv1_3
     unsecure_socket: socket = create_connection((server_address, server_port))
     secure_socket = context.wrap_socket(
         unsecure_socket
     )  # , server_hostname="localhost")
 
     while True:
-        message = input()
-        secure_socket.send(message.encode("utf-8"))
+        message = input().encode("utf-8")
+        secure_socket.sendall(message)
         reply = secure_socket.recv(len(message))
         if reply == b"quit":
             break
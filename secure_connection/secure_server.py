@@ -16,16 +16,27 @@ Functions:
     
     main(address: str, port: int) -> None:
         Sets up and starts the SSL server with the necessary certificates.
+
+The server runs on uvloop when it is installed and falls back to the
+standard asyncio event loop otherwise.
 """
 import logging
-from asyncio import StreamReader, StreamWriter, run, start_server
+from asyncio import StreamReader, StreamWriter, start_server
 from pathlib import Path
 from ssl import Purpose, create_default_context
 
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
 
 async def handle_client(reader: StreamReader, writer: StreamWriter):
     while True:
-        msg_bytes = await reader.read(10)
+        # Read whatever has arrived, up to 64 KiB, instead of 10-byte slices.
+        msg_bytes = await reader.read(65536)
+        if not msg_bytes:
+            break
         if msg_bytes == b"quit":
             writer.write(b"quit")
             await writer.drain()
@@ -26,14 +26,18 @@ Usage:
 
 Note:
   The `__getattribute__` method in the `Number` class is implemented such that if
-  an attribute other than the ones listed in the `options` list is accessed, the
+  an attribute other than the ones listed in the `OPTIONS` set is accessed, the
   `_number` attribute value is returned. This is demonstrated in the script where
   `number.num` and `number.number` (which are non-existing attributes) are accessed,
   but the `_number` value is printed instead of raising an AttributeError.
 """
 
+OPTIONS = frozenset(("power", "another_func", "__class__"))
+
 
 class Number:
+    __slots__ = ("_number",)
+
     def __init__(self, number):
         self._number = number
 
@@ -45,18 +49,18 @@ class Number:
 
     def __setattr__(self, name, value):
         # print(name, type(name), value, type(value))
-        super().__setattr__("_number", 0)
-        try:
-            if isinstance(value, int):
-                super().__setattr__("_number", value)
-            elif isinstance(value, str):
-                super().__setattr__("_number", int(value))
-        except ValueError:
-            return
+        number = 0
+        if isinstance(value, int):
+            number = value
+        elif isinstance(value, str):
+            try:
+                number = int(value)
+            except ValueError:
+                pass
+        super().__setattr__("_number", number)
 
     def __getattribute__(self, name):
-        options = ["power", "another_func", "__class__"]
-        if name in options:
+        if name in OPTIONS:
             return super().__getattribute__(name)
         else:
             return super().__getattribute__("_number")
@@ -5,12 +5,11 @@ This module demonstrates the use of asyncio to handle asynchronous and blocking
 functions in Python. The module contains three functions: a blocking function
 that simulates a long-running process with `time.sleep`, an asynchronous
 function that demonstrates asyncio's sleep, and a main function that runs
-both the blocking and async functions concurrently using a ThreadPoolExecutor 
-for the blocking function.
+both the blocking and async functions concurrently, running the blocking
+function in the event loop's default ThreadPoolExecutor via asyncio.to_thread.
 """
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 import time
 
 
@@ -27,18 +26,13 @@ async def async_function():
 
 
 async def main():
-    loop = asyncio.get_event_loop()
-    executor = ThreadPoolExecutor()
+    async_task = asyncio.create_task(async_function())
 
-    async_task = loop.create_task(async_function())
-
-    result = await loop.run_in_executor(executor, blocking_function)
+    result = await asyncio.to_thread(blocking_function)
     print(result)
 
     await async_task
 
 
 if __name__ == "__main__":
-    loop = asyncio.get_event_loop()
-    main_task = loop.create_task(main())
-    loop.run_until_complete(main_task)
+    asyncio.run(main())
@@ -1,19 +1,20 @@
 #!/usr/bin/env python3
 import timeit
+from dataclasses import dataclass
 from functools import partial
 from time import sleep
-from typing import List
+from typing import List, Optional
 from random import randint
 from typing import Dict
 from concurrent.futures import ThreadPoolExecutor, Future
 
 from prompt_toolkit.shortcuts import ProgressBar
-from pydantic import BaseModel
 
-results: List[int] = []
+results: List[Optional[int]] = []
 
 
-class Result(BaseModel):
+@dataclass(slots=True)
+class Result:
     result: int
 
     def __repr__(self) -> str:
@@ -35,24 +36,26 @@ def add_one(number: int) -> int:
     return result
 
 
-def aggregate_results(future: Future):
-    results.append(future.result())
+def aggregate_results(index: int, future: Future):
+    results[index] = future.result()
 
 
 def first_method():
+    results[:] = [None] * 10
     with ProgressBar() as pb:
         with ThreadPoolExecutor(32) as executor:
             futures = [executor.submit(add_one, number) for number in range(10)]
-            for future in pb(futures, label="Processing tasks..."):
-                future.add_done_callback(aggregate_results)
+            for index, future in enumerate(pb(futures, label="Processing tasks...")):
+                future.add_done_callback(partial(aggregate_results, index))
 
 
 def second_method():
+    results[:] = [None] * 10
     futures = []
     with ThreadPoolExecutor(32) as executor:
         for number in range(10):
             futures.append(executor.submit(add_one, number))
-            futures[-1].add_done_callback(aggregate_results)
+            futures[-1].add_done_callback(partial(aggregate_results, number))
 
 
 def add_one_result(result: Result) -> Result:
@@ -95,7 +98,6 @@ def main():
     print(timeit.timeit(first_method, number=1))
     print(results)
     print("All done!\n")
-    results.clear()
     print(timeit.timeit(second_method, number=1))
     print(results)
     print("All done!")
@@ -1,13 +1,15 @@
 #!/usr/bin/env python3
-from time import sleep
 from random import randint
+from threading import Event
 from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
 
 results: list[int] = []
+# Set once the first result is in so the remaining workers stop sleeping.
+stop_event = Event()
 
 
 def add_one(number: int) -> int:
-    sleep(randint(0, 2))
+    stop_event.wait(randint(0, 2))
     return number + 1
 
 
@@ -15,6 +17,7 @@ def main() -> None:
     executor = ThreadPoolExecutor(32)
     futures: list[Future] = [executor.submit(add_one, number) for number in range(10)]
     done, not_done = wait(futures, return_when=FIRST_COMPLETED)
+    stop_event.set()
     executor.shutdown(wait=False, cancel_futures=True)
     print(done.pop().result())
 